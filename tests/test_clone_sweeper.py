@@ -0,0 +1,97 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import clone_sweeper as cs
+
+
+def make_row(name, description):
+    return {
+        "name": name,
+        "description": description,
+        "stargazers_count": 0,
+        "forks_count": 0,
+        "watchers_count": 0,
+        "open_issues_count": 0,
+        "pushed_at": "2024-01-01T00:00:00Z",
+        "clone_count": 1,
+        "clone_uniques": 1,
+        "download_14d": None,
+        "download_total": None,
+    }
+
+
+class TableSvgTest(unittest.TestCase):
+    def render_table(self, rows):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = os.path.join(tmp, "table.svg")
+            with contextlib.redirect_stdout(io.StringIO()):
+                cs.generate_table_svg_jinja("octo", rows, False, out_path=out_path)
+            with open(out_path, encoding="utf-8") as f:
+                return f.read()
+
+    def test_description_whitespace_is_stripped(self):
+        svg = self.render_table([
+            make_row("padded", "  Aims to develop a model.  "),
+            make_row("blank", "   "),
+        ])
+        self.assertIn('class="td card">Aims to develop a model.</text>', svg)
+        self.assertNotIn("> Aims", svg)
+        self.assertNotIn("model.  <", svg)
+        # A whitespace-only description renders as the "-" placeholder
+        self.assertIn('class="muted card">-</text>', svg)
+
+
+def fake_page(url, token=None, params=None, max_age=None):
+    """Serve page N of a 6-page listing as [N*10, N*10+1], with GitHub-style Link headers."""
+    page = int(cs.parse_qs(cs.urlparse(url).query).get("page", ["1"])[0])
+    r = cs.requests.Response()
+    r.status_code = 200
+    r._content = json.dumps([page * 10, page * 10 + 1]).encode()
+    if page == 1:
+        r.headers["Link"] = ('<https://api.example/items?per_page=2&page=2>; rel="next", '
+                             '<https://api.example/items?per_page=2&page=6>; rel="last"')
+    return r
+
+
+class PaginateTest(unittest.TestCase):
+    def tearDown(self):
+        cs.configure_session()
+
+    def paginate_with_workers(self):
+        workers = []
+        real_executor = cs.ThreadPoolExecutor
+
+        def recording_executor(max_workers):
+            workers.append(max_workers)
+            return real_executor(max_workers=max_workers)
+
+        with mock.patch.object(cs, "_fetch_page", fake_page), \
+             mock.patch.object(cs, "ThreadPoolExecutor", recording_executor):
+            items = cs.paginate("https://api.example/items")
+        return items, workers
+
+    def test_pages_fetched_in_parallel_keep_order(self):
+        items, _ = self.paginate_with_workers()
+        self.assertEqual(items, [n for page in range(1, 7) for n in (page * 10, page * 10 + 1)])
+
+    def test_page_threads_follow_configured_concurrency(self):
+        cs.configure_session(2)
+        _, workers = self.paginate_with_workers()
+        self.assertEqual(workers, [2])
+
+        cs.configure_session(20)
+        _, workers = self.paginate_with_workers()
+        # Never more threads than remaining pages (2..6)
+        self.assertEqual(workers, [5])
+
+
+if __name__ == "__main__":
+    unittest.main()